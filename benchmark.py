@@ -0,0 +1,174 @@
+"""
+Benchmark harness for the MAX-SC-QBF operators.
+
+Times instance loading, objective and delta evaluation, feasibility repair and full GA
+generations over the bundled instances (n = 25 to 400), and saves the results as JSON so
+runs from different commits can be compared. The bundled instances are all dense, so
+synthetic sparse instances are also benchmarked with both the dense and sparse backends:
+
+    python benchmark.py --output bench_new.json --compare bench_old.json
+"""
+from scqbf.scqbf_instance import *
+from scqbf.scqbf_solution import *
+from scqbf.scqbf_evaluator import *
+from scqbf.scqbf_ga import *
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import timeit
+
+DEFAULT_INSTANCES = [
+    "instances/gen025_01.txt",
+    "instances/gen050_01.txt",
+    "instances/gen100_01.txt",
+    "instances/gen200_01.txt",
+    "instances/gen400_01.txt",
+]
+
+DEFAULT_SPARSE_INSTANCES = ["1000:0.02"]
+
+def synthetic_sparse_instance(n: int, density: float, seed: int = 0, backend: str = "sparse") -> ScQbfInstance:
+    """
+    Random instance whose upper triangle has the given density of integer coefficients in [-10, 10].
+    Subset i always covers element i, plus each other element with probability 1%, so it is feasible.
+    """
+    rng = np.random.default_rng(seed)
+    A = np.triu(np.where(rng.random((n, n)) < density, rng.integers(-10, 11, size=(n, n)), 0)).astype(np.float64)
+    incidence = rng.random((n, n)) < 0.01
+    np.fill_diagonal(incidence, True)
+    return ScQbfInstance(n, A, incidence, backend=backend)
+
+def _seconds_per_call(fn, number: int, repeat: int) -> float:
+    """ Best-of-repeat average time of one call, as timeit recommends. """
+    return min(timeit.Timer(fn).repeat(repeat=repeat, number=number)) / number
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def benchmark_instance(path: str, repeat: int = 5, generations: int = 20, population_size: int = 100,
+                       seed: int = 0) -> dict:
+    """ Run every micro-benchmark on one instance file; times are seconds per call unless noted. """
+    results = {'instance': path}
+
+    results['load_text'] = _seconds_per_call(lambda: read_max_sc_qbf_instance(path), 1, repeat)
+    instance = read_max_sc_qbf_instance(path)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        binary_path = os.path.join(tmp, "instance" + BINARY_EXTENSION)
+        write_max_sc_qbf_instance_binary(instance, binary_path)
+        results['load_binary_mmap'] = _seconds_per_call(lambda: load_max_sc_qbf_instance_binary(binary_path), 1, repeat)
+
+    return benchmark_operators(instance, results, repeat, generations, population_size, seed)
+
+def benchmark_operators(instance: ScQbfInstance, results: dict, repeat: int = 5, generations: int = 20,
+                        population_size: int = 100, seed: int = 0) -> dict:
+    """ Time evaluation, repair and GA generations on a loaded instance, adding the timings to results. """
+    rng = np.random.default_rng(seed)
+    n = instance.n
+    results['n'] = n
+    results['backend'] = instance.backend
+    results['density'] = instance.density()
+
+    evaluator = ScQbfEvaluator(instance)
+    X = (rng.random((population_size, n)) < 0.5).astype(np.uint8)
+    elements = np.flatnonzero(X[0]).tolist()
+    elem_in = int(np.flatnonzero(X[0] == 0)[0]) if (X[0] == 0).any() else 0
+    elem_out = elements[0] if elements else 0
+
+    results['evaluate_objfun'] = _seconds_per_call(lambda: evaluator.evaluate_objfun(ScQbfSolution(elements)), 100, repeat)
+    results['evaluate_objfun_batch_per_solution'] = _seconds_per_call(
+        lambda: evaluator.evaluate_objfun_batch(X), 10, repeat) / population_size
+
+    solution = ScQbfSolution(elements)
+    results['evaluate_insertion_delta'] = _seconds_per_call(lambda: evaluator.evaluate_insertion_delta(elem_in, solution), 200, repeat)
+    results['evaluate_removal_delta'] = _seconds_per_call(lambda: evaluator.evaluate_removal_delta(elem_out, solution), 200, repeat)
+    results['evaluate_exchange_delta'] = _seconds_per_call(
+        lambda: evaluator.evaluate_exchange_delta(elem_in, elem_out, solution), 200, repeat)
+
+    state = evaluator.create_evaluated_solution(solution)
+    results['incremental_exchange_delta'] = _seconds_per_call(lambda: state.exchange_delta(elem_in, elem_out), 1000, repeat)
+    results['incremental_flip'] = _seconds_per_call(lambda: (state.flip(elem_in), state.flip(elem_in)), 200, repeat) / 2
+
+    # Repair from sparse random chromosomes, which are almost never feasible
+    ga = ScQbfGA(instance, population_size=population_size, seed=seed)
+    sparse = (rng.random((population_size, n)) < 2 / n).astype(np.uint8)
+    results['make_feasible'] = _seconds_per_call(
+        lambda: [ga._make_feasible(chromosome.copy()) for chromosome in sparse], 1, repeat) / population_size
+
+    for engine in ("standard", "vectorized"):
+        ga = ScQbfGA(instance, population_size=population_size, ga_strategy=GAStrategy(engine=engine),
+                     termination_options={'max_iter': generations}, seed=seed)
+        ga._initialize_search()
+        start = time.perf_counter()
+        for _ in range(generations):
+            ga._iter += 1
+            ga._run_generation()
+        results[f'generations_per_sec_{engine}'] = generations / (time.perf_counter() - start)
+
+    return results
+
+def compare(current: dict, baseline: dict):
+    """ Print the speedup of every timing in current relative to baseline (>1 means faster now). """
+    baseline_by_instance = {result['instance']: result for result in baseline['results']}
+    for result in current['results']:
+        old = baseline_by_instance.get(result['instance'])
+        if old is None:
+            continue
+        print(f"{result['instance']} (n={result['n']}):")
+        for metric, value in result.items():
+            if metric == 'density' or not isinstance(value, float) or not isinstance(old.get(metric), float) or value == 0 or old[metric] == 0:
+                continue
+            speedup = value / old[metric] if metric.startswith('generations_per_sec') else old[metric] / value
+            print(f"\t{metric:40s} {speedup:6.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MAX-SC-QBF operators over the bundled instances.")
+    parser.add_argument("--instances", nargs="+", default=DEFAULT_INSTANCES, help="Instance files to benchmark.")
+    parser.add_argument("--sparse", nargs="*", default=DEFAULT_SPARSE_INSTANCES, metavar="N:DENSITY",
+                        help="Synthetic sparse instances, benchmarked with both backends.")
+    parser.add_argument("--output", default="bench_results.json", help="JSON file to write the results to.")
+    parser.add_argument("--compare", default=None, help="Previous results JSON to compare against.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per timing (best is kept).")
+    parser.add_argument("--generations", type=int, default=20, help="Generations timed per GA engine.")
+    parser.add_argument("--population-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'results': [],
+    }
+    for path in args.instances:
+        print(f"Benchmarking {path}...", flush=True)
+        report['results'].append(benchmark_instance(path, repeat=args.repeat, generations=args.generations,
+                                                    population_size=args.population_size, seed=args.seed))
+    for spec in args.sparse:
+        n, density = spec.split(":")
+        for backend in ("dense", "sparse"):
+            label = f"synthetic(n={n}, density={density}, backend={backend})"
+            print(f"Benchmarking {label}...", flush=True)
+            instance = synthetic_sparse_instance(int(n), float(density), seed=args.seed, backend=backend)
+            report['results'].append(benchmark_operators(instance, {'instance': label}, repeat=args.repeat,
+                                                         generations=args.generations,
+                                                         population_size=args.population_size, seed=args.seed))
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,16 @@ from scqbf.scqbf_solution import *
 from scqbf.scqbf_evaluator import *
 from scqbf.scqbf_ga import *
 
-def run_single_experiment(args):
+def run_single_experiment(args, time_limit: float = 60 * 30, seed=None):
     """Helper function to run a single experiment"""
     instance_path, gen, inst, exp_num, config, pop_size, mutation_rate = args
     
     try:
         print(f"Running experiment {exp_num} with instance {instance_path}")
-        instance = read_max_sc_qbf_instance(instance_path)
+        instance = load_instance(instance_path)
         
-        time_limit = 60 * 30
-        ga = ScQbfGA(instance, pop_size, mutation_rate, termination_options={'time_limit_secs': time_limit, 'patience': 10*instance.n}, ga_strategy=config)
+        ga = ScQbfGA(instance, pop_size, mutation_rate, termination_options={'time_limit_secs': time_limit, 'patience': 10*instance.n}, ga_strategy=config,
+                     seed=seed)
         best_solution = ga.solve()
 
         evaluator = ScQbfEvaluator(instance)
@@ -0,0 +1,140 @@
+"""
+Command-line experiment runner.
+
+Expands an instance x config x pop_size x mutation_rate grid (times --repetitions), runs the
+cells on a process pool with the largest instances scheduled first, and appends each result
+to a JSONL file as soon as it completes. Cells already present in the output file are
+skipped, so an interrupted run is resumed by re-running the same command:
+
+    python run_experiments.py --configs configs.json --pop-sizes 100 200 --mutation-rates 1 2 \\
+        --output results.jsonl
+
+The configs file holds a JSON list of GAStrategy keyword dicts, e.g.
+[{"population_init": "random"}, {"mutation_strategy": "adaptive"}].
+"""
+from scqbf.scqbf_instance import *
+from scqbf.scqbf_ga import *
+from exp_utils import run_single_experiment
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import glob
+import itertools
+import json
+import os
+import re
+import zlib
+
+DEFAULT_INSTANCES = [f"instances/gen{i}/instance{j}.txt" for i in range(1, 4) for j in range(1, 6)]
+
+def _instance_labels(instance_path: str):
+    """ (gen, inst) labels as used by the notebooks: instances/gen2/instance3.txt -> (2, 3), gen100_02.txt -> (100, 2). """
+    match = re.search(r"gen(\d+)[/\\]instance(\d+)", instance_path) or re.search(r"gen(\d+)_(\d+)", instance_path)
+    if match is None:
+        return None, os.path.basename(instance_path)
+    return int(match.group(1)), int(match.group(2))
+
+def _cell_key(cell: dict) -> str:
+    return json.dumps([cell['instance_path'], cell['config'], cell['pop_size'], cell['mutation_rate'], cell['repetition']],
+                      sort_keys=True)
+
+def _load_configs(value: str) -> list:
+    """ Configs are given inline as JSON or as the path of a JSON file; a single dict is accepted too. """
+    if os.path.exists(value):
+        with open(value) as f:
+            configs = json.load(f)
+    else:
+        configs = json.loads(value)
+    configs = [configs] if isinstance(configs, dict) else configs
+
+    for config in configs:
+        GAStrategy(**config)  # Fail early on unknown options
+    return configs
+
+def _finished_keys(output_path: str) -> set:
+    """ Keys of the cells already recorded in output_path; a truncated last line is ignored. """
+    finished = set()
+    if not os.path.exists(output_path):
+        return finished
+
+    with open(output_path) as f:
+        for line in f:
+            try:
+                finished.add(_cell_key(json.loads(line)))
+            except (json.JSONDecodeError, KeyError):
+                continue
+    return finished
+
+def expand_grid(instance_paths: list, configs: list, pop_sizes: list, mutation_rates: list, repetitions: int) -> list:
+    """ All cells of the grid, sorted so the longest jobs (largest n, then population) come first. """
+    sizes = {path: load_instance(path).n for path in instance_paths}
+    cells = [
+        {'instance_path': path, 'n': sizes[path], 'config': config, 'pop_size': pop_size,
+         'mutation_rate': mutation_rate, 'repetition': repetition}
+        for path, config, pop_size, mutation_rate, repetition
+        in itertools.product(instance_paths, configs, pop_sizes, mutation_rates, range(repetitions))
+    ]
+    cells.sort(key=lambda cell: (cell['n'], cell['pop_size']), reverse=True)
+    return cells
+
+def _cell_seed(base_seed: int, cell: dict):
+    """ Reproducible per-cell seed that does not depend on the grid order. """
+    if base_seed is None:
+        return None
+    return np.random.SeedSequence([base_seed, zlib.crc32(_cell_key(cell).encode())])
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a grid of MAX-SC-QBF GA experiments in parallel.")
+    parser.add_argument("--instances", nargs="+", default=DEFAULT_INSTANCES, help="Instance files or glob patterns.")
+    parser.add_argument("--configs", default="[{}]", help="JSON list of GAStrategy options, inline or as a file path.")
+    parser.add_argument("--pop-sizes", nargs="+", type=int, default=[100])
+    parser.add_argument("--mutation-rates", nargs="+", type=float, default=[1.0])
+    parser.add_argument("--repetitions", type=int, default=1)
+    parser.add_argument("--time-limit", type=float, default=60 * 30, help="Time limit of each run, in seconds.")
+    parser.add_argument("--seed", type=int, default=None, help="Base seed; each cell derives its own from it.")
+    parser.add_argument("--workers", type=int, default=max((os.cpu_count() or 4) - 2, 1))
+    parser.add_argument("--output", default="results.jsonl", help="JSONL file results are appended to.")
+    args = parser.parse_args()
+
+    instance_paths = [path for pattern in args.instances for path in (sorted(glob.glob(pattern)) or [pattern])]
+    try:
+        configs = _load_configs(args.configs)
+    except (json.JSONDecodeError, TypeError) as e:
+        parser.error(f"Invalid --configs: {e}")
+
+    cells = expand_grid(instance_paths, configs, args.pop_sizes, args.mutation_rates, args.repetitions)
+    finished = _finished_keys(args.output)
+    pending = [cell for cell in cells if _cell_key(cell) not in finished]
+    print(f"{len(cells)} cells, {len(cells) - len(pending)} already finished, {len(pending)} to run.", flush=True)
+    if not pending:
+        return
+
+    with open(args.output, 'a') as output, ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {}
+        for exp_num, cell in enumerate(pending, start=1):
+            gen, inst = _instance_labels(cell['instance_path'])
+            experiment_args = (cell['instance_path'], gen, inst, exp_num, GAStrategy(**cell['config']),
+                               cell['pop_size'], cell['mutation_rate'])
+            future = executor.submit(run_single_experiment, experiment_args, args.time_limit, _cell_seed(args.seed, cell))
+            futures[future] = cell
+
+        try:
+            for future in as_completed(futures):
+                cell = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Not recorded, so the cell is retried on the next run
+                    print(f"Cell {_cell_key(cell)} failed with error: {e}", flush=True)
+                    continue
+
+                output.write(json.dumps({**cell, **result, 'time_limit': args.time_limit, 'seed': args.seed}) + "\n")
+                output.flush()
+                os.fsync(output.fileno())
+                print(f"Completed {cell['instance_path']} (n={cell['n']}): best objective = {result['best_objective']:.4f}", flush=True)
+        except KeyboardInterrupt:
+            print("Interrupted. Cancelling pending cells; finished results are kept in the output file.")
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
+import numpy as np
+
+class ScQbfFitnessCache:
+    """
+    Bounded LRU cache of chromosome fitness values.
+
+    Entries store only the fitness and, optionally, the decoded element indices
+    (as a compact int32 array). When max_size is reached the least recently used
+    entry is evicted. Hit, miss and eviction counters are kept so the cache can be
+    sized per instance; max_size=None disables the bound.
+    """
+
+    def __init__(self, max_size: Optional[int] = 50_000, store_elements: bool = False):
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"Cache max_size must be positive or None, got {max_size}.")
+
+        self.max_size = max_size
+        self.store_elements = store_elements
+        self._entries: "OrderedDict[Hashable, Tuple[float, Optional[np.ndarray]]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, Optional[List[int]]]]:
+        """ Look up (fitness, elements) for key, or None on a miss. Elements are None unless stored. """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        fitness, elements = entry
+        return fitness, (elements.tolist() if elements is not None else None)
+
+    def put(self, key: Hashable, fitness: float, elements: Optional[List[int]] = None):
+        stored_elements = None
+        if self.store_elements and elements is not None:
+            stored_elements = np.asarray(elements, dtype=np.int32)
+
+        self._entries[key] = (fitness, stored_elements)
+        self._entries.move_to_end(key)
+
+        if self.max_size is not None:
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def items(self) -> List[Tuple[Hashable, float]]:
+        """ (key, fitness) pairs from least to most recently used, without touching the counters. """
+        return [(key, fitness) for key, (fitness, _) in self._entries.items()]
+
+    def clear(self):
+        self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+        }
@@ -0,0 +1,67 @@
+import json
+import os
+import signal
+import threading
+import numpy as np
+
+from typing import Dict, Iterable, Tuple
+
+CHECKPOINT_VERSION = 1
+
+def write_checkpoint(path: str, arrays: Dict[str, np.ndarray], metadata: dict):
+    """
+    Write a checkpoint as an .npz archive: the given arrays plus the metadata as a JSON string.
+    The archive is written to a temporary file, synced to disk and only then renamed over path,
+    so neither a killed process nor a host crash mid-write leaves a truncated checkpoint behind.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, metadata=np.array(json.dumps({'version': CHECKPOINT_VERSION, **metadata})), **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def read_checkpoint(path: str) -> Tuple[Dict[str, np.ndarray], dict]:
+    """ Read a checkpoint written by write_checkpoint; returns (arrays, metadata). """
+    with np.load(path, allow_pickle=False) as archive:
+        arrays = {name: archive[name] for name in archive.files if name != 'metadata'}
+        metadata = json.loads(str(archive['metadata']))
+
+    if metadata.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {metadata.get('version')} in {path}.")
+    return arrays, metadata
+
+def _signal_number(sig) -> int:
+    return getattr(signal, sig) if isinstance(sig, str) else int(sig)
+
+class ScQbfCheckpointSignals:
+    """
+    Context manager turning signals into flags checked at generation boundaries: any of the
+    save_signals or stop_signals requests a checkpoint, and stop_signals also request the
+    search to stop. Handlers can only be installed from the main thread; elsewhere (and for
+    signals the platform lacks) this is a no-op. Previous handlers are restored on exit.
+    """
+
+    def __init__(self, save_signals: Iterable = ("SIGUSR1",), stop_signals: Iterable = ("SIGTERM",)):
+        self._save_signals = {_signal_number(sig) for sig in save_signals if not isinstance(sig, str) or hasattr(signal, sig)}
+        self._stop_signals = {_signal_number(sig) for sig in stop_signals if not isinstance(sig, str) or hasattr(signal, sig)}
+        self._previous_handlers = {}
+        self.save_requested = False
+        self.stop_requested = False
+
+    def _handle(self, signum, frame):
+        self.save_requested = True
+        if signum in self._stop_signals:
+            self.stop_requested = True
+
+    def __enter__(self):
+        if threading.current_thread() is threading.main_thread():
+            for signum in self._save_signals | self._stop_signals:
+                self._previous_handlers[signum] = signal.signal(signum, self._handle)
+        return self
+
+    def __exit__(self, *exc):
+        for signum, handler in self._previous_handlers.items():
+            signal.signal(signum, handler)
+        self._previous_handlers.clear()
+        return False
@@ -1,5 +1,6 @@
 from .scqbf_instance import *
 from .scqbf_solution import *
+import numpy as np
 
 class ScQbfEvaluator:
     
@@ -13,34 +14,54 @@ class ScQbfEvaluator:
         if solution._objfun_val != None:
             return solution._objfun_val
         
-        A = self.problem_instance.A
-        total = 0.0
+        idx = np.asarray(solution.elements, dtype=np.intp)
 
-        # Calculate QBF value directly from solution indices
-        for i in solution.elements:
-            for j in solution.elements:
-                total += A[i][j]
+        if self.problem_instance.backend == "sparse":
+            # Sum the stored nonzeros of the selected rows whose column is also selected
+            A_csr = self.problem_instance.A_csr
+            selected = np.zeros(self.problem_instance.n, dtype=bool)
+            selected[idx] = True
+            entries = A_csr.row_entries(idx)
+            total = float(A_csr.data[entries][selected[A_csr.indices[entries]]].sum())
+        else:
+            # Calculate QBF value directly from solution indices
+            A = self.problem_instance.A
+            total = float(A[np.ix_(idx, idx)].sum())
 
         solution._objfun_val = total
         return total
 
+    def evaluate_objfun_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the objective function for a whole population at once.
+        X is a (P x n) 0/1 matrix, one row per solution; returns the P objective values.
+        """
+        if self.problem_instance is None:
+            raise ValueError("Problem instance is not initialized")
+
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != self.problem_instance.n:
+            raise ValueError(f"Expected a (P x {self.problem_instance.n}) matrix, got shape {X.shape}.")
+
+        # Row-wise x^T A x from a single matrix product. BLAS on the dense A beats gathering the
+        # CSR nonzeros for every row of X at all densities, so both backends take this path.
+        return np.einsum('pi,pi->p', X @ self.problem_instance.A, X)
+
     def _evaluate_element_contribution(self, elem: int, solution: ScQbfSolution) -> float:
         """
         Calculate the contribution of an element given a list of other elements it interacts with.
         This includes both the diagonal term and interactions with other elements.
         """
-        A = self.problem_instance.A
-        total = 0.0
+        A_sym = self.problem_instance.A_sym
+        idx = np.asarray(solution.elements, dtype=np.intp)
         
-        # Add interactions with other elements
-        for j in solution.elements:
-            if j != elem:  # Avoid self-interaction in the loop
-                total += A[elem][j] + A[j][elem]
+        # Add interactions with other elements, avoiding self-interaction
+        total = A_sym[elem, idx[idx != elem]].sum()
         
         # Add diagonal element contribution
-        total += A[elem][elem]
+        total += A_sym[elem, elem]
         
-        return total
+        return float(total)
 
     def evaluate_insertion_delta(self, elem: int, solution: ScQbfSolution) -> float:
         if self.problem_instance is None:
@@ -74,32 +95,35 @@ class ScQbfEvaluator:
         if elem_out not in solution.elements:
             return self.evaluate_insertion_delta(elem_in, solution)
         
-        A = self.problem_instance.A
+        A_sym = self.problem_instance.A_sym
         total = 0.0
 
         total += self._evaluate_element_contribution(elem_in, solution)
         total -= self._evaluate_element_contribution(elem_out, solution)
 
         # Subtract interaction between elem_in and elem_out
-        total -= (A[elem_in][elem_out] + A[elem_out][elem_in])
+        total -= A_sym[elem_in, elem_out]
         
         return total
     
+    def _covered_mask(self, solution: ScQbfSolution) -> np.ndarray:
+        """ Boolean mask over the (0-based) domain elements covered by the solution's subsets. """
+        idx = np.asarray(solution.elements, dtype=np.intp)
+        return self.problem_instance.incidence[idx].any(axis=0)
+
+    def create_evaluated_solution(self, solution: ScQbfSolution) -> "ScQbfEvaluatedSolution":
+        """ Build the incremental evaluation state for a solution, for O(1) delta queries. """
+        if self.problem_instance is None:
+            raise ValueError("Problem instance is not initialized")
+
+        return ScQbfEvaluatedSolution(self.problem_instance, solution.elements)
+
     def evaluate_coverage(self, solution: ScQbfSolution) -> float:
         if self.problem_instance is None:
             raise ValueError("Problem instance is not initialized")
 
-        # Find the maximum element across all subsets to determine domain size
         domain_size = self.problem_instance.n
-        
-        covered = [False] * (domain_size)
-        covered_count = 0
-
-        for idx in solution.elements:
-            for elem in self.problem_instance.subsets[idx]:
-                if not covered[elem-1]:
-                    covered[elem-1] = True
-                    covered_count += 1
+        covered_count = int(self._covered_mask(solution).sum())
         
         return covered_count / domain_size
 
@@ -110,22 +134,161 @@ class ScQbfEvaluator:
         if elem in solution.elements:
             return 0.0
 
-        # Calculate coverage delta more efficiently
         domain_size = self.problem_instance.n
-        covered = [False] * domain_size
-        
-        # Mark elements already covered by current solution
-        for idx in solution.elements:
-            for element in self.problem_instance.subsets[idx]:
-                covered[element-1] = True
+        covered = self._covered_mask(solution)
         
         # Count new elements that would be covered by adding elem
-        new_covered_count = 0
-        for element in self.problem_instance.subsets[elem]:
-            if not covered[element-1]:
-                new_covered_count += 1
+        new_covered_count = int(np.count_nonzero(self.problem_instance.incidence[elem] & ~covered))
         
         return new_covered_count / domain_size
 
     def is_solution_feasible(self, solution: ScQbfSolution):
-        return self.evaluate_coverage(solution) == 1.0
\ No newline at end of file
+        return self.evaluate_coverage(solution) == 1.0
+
+
+class ScQbfEvaluatedSolution:
+    """
+    A solution together with the incremental state needed for O(1) move evaluation.
+
+    Keeps the selection mask x, the interaction vector g = A_sym @ x and the current
+    objective value. Since g[i] is the summed row/column contribution of variable i
+    against the current set, the insertion delta of i is g[i] + A[i][i], the removal
+    delta is -g[i], and applying a flip updates g with a single column in O(n).
+    With the sparse backend, g is built from the CSR nonzeros of the selected rows.
+    """
+
+    def __init__(self, problem_instance: ScQbfInstance, elements: List[int] = ()):
+        self.problem_instance = problem_instance
+        self._diag = np.diagonal(problem_instance.A_sym)
+
+        self.selected = np.zeros(problem_instance.n, dtype=bool)
+        self.selected[np.asarray(elements, dtype=np.intp)] = True
+        if problem_instance.backend == "sparse":
+            A_sym_csr = problem_instance.A_sym_csr
+            entries = A_sym_csr.row_entries(np.flatnonzero(self.selected))
+            # bincount returns int64 when no entries are selected, so force the dtype
+            self.interaction = np.bincount(A_sym_csr.indices[entries], weights=A_sym_csr.data[entries],
+                                           minlength=problem_instance.n).astype(np.float64)
+        else:
+            self.interaction = problem_instance.A_sym[:, self.selected].sum(axis=1)
+        self.objfun_val = float(self.interaction[self.selected].sum() + self._diag[self.selected].sum()) / 2
+
+    @property
+    def elements(self) -> List[int]:
+        return np.flatnonzero(self.selected).tolist()
+
+    def to_solution(self) -> ScQbfSolution:
+        return ScQbfSolution(self.elements, self.objfun_val)
+
+    def insertion_delta(self, elem: int) -> float:
+        if self.selected[elem]:
+            return 0.0
+        return float(self.interaction[elem] + self._diag[elem])
+
+    def removal_delta(self, elem: int) -> float:
+        if not self.selected[elem]:
+            return 0.0
+        return -float(self.interaction[elem])
+
+    def exchange_delta(self, elem_in: int, elem_out: int) -> float:
+        if elem_in == elem_out:
+            return 0.0
+        if self.selected[elem_in]:
+            return self.removal_delta(elem_out)
+        if not self.selected[elem_out]:
+            return self.insertion_delta(elem_in)
+
+        return float(self.interaction[elem_in] + self._diag[elem_in] - self.interaction[elem_out]
+                     - self.problem_instance.A_sym[elem_in, elem_out])
+
+    def insertion_deltas(self) -> np.ndarray:
+        """ Insertion delta of every variable at once (0 for already selected ones). """
+        return np.where(self.selected, 0.0, self.interaction + self._diag)
+
+    def removal_deltas(self) -> np.ndarray:
+        """ Removal delta of every variable at once (0 for unselected ones). """
+        return np.where(self.selected, -self.interaction, 0.0)
+
+    def insert(self, elem: int) -> float:
+        """ Add elem to the solution, returning the objective delta. """
+        delta = self.insertion_delta(elem)
+        if not self.selected[elem]:
+            self._apply_flip(elem, delta)
+        return delta
+
+    def remove(self, elem: int) -> float:
+        """ Remove elem from the solution, returning the objective delta. """
+        delta = self.removal_delta(elem)
+        if self.selected[elem]:
+            self._apply_flip(elem, delta)
+        return delta
+
+    def flip(self, elem: int) -> float:
+        """ Toggle elem in the solution, returning the objective delta. """
+        return self.remove(elem) if self.selected[elem] else self.insert(elem)
+
+    def exchange(self, elem_in: int, elem_out: int) -> float:
+        """ Swap elem_out for elem_in, returning the objective delta. """
+        return self.remove(elem_out) + self.insert(elem_in)
+
+    def _apply_flip(self, elem: int, delta: float):
+        sign = -1.0 if self.selected[elem] else 1.0
+        self.selected[elem] = not self.selected[elem]
+        # A contiguous O(n) row update is faster than a scattered update of the row's
+        # nonzeros even on sparse instances, so both backends use the dense row
+        self.interaction += sign * self.problem_instance.A_sym[elem]
+        self.objfun_val += delta
+
+
+class ScQbfCoverageTracker:
+    """
+    Incremental coverage state of a solution.
+
+    Keeps, per domain element, how many selected subsets cover it, plus the number of
+    uncovered elements. Insertions and removals update the counts with vectorized operations
+    over the subset's n-length incidence row, in O(n), and the candidates that cover something
+    new are found through the instance's inverted element -> subsets index, reading only the
+    rows of the elements that are still uncovered.
+    """
+
+    def __init__(self, problem_instance: ScQbfInstance, elements: List[int] = ()):
+        self.problem_instance = problem_instance
+        self.selected = np.zeros(problem_instance.n, dtype=bool)
+        self.selected[np.asarray(elements, dtype=np.intp)] = True
+        self.cover_counts = problem_instance.incidence[self.selected].sum(axis=0, dtype=np.int32)
+        self.uncovered_count = int(np.count_nonzero(self.cover_counts == 0))
+
+    @property
+    def uncovered(self) -> np.ndarray:
+        """ Indices of the (0-based) domain elements not covered yet. """
+        return np.flatnonzero(self.cover_counts == 0)
+
+    def is_feasible(self) -> bool:
+        return self.uncovered_count == 0
+
+    def insert(self, subset: int):
+        if self.selected[subset]:
+            return
+        self.selected[subset] = True
+        covered = self.problem_instance.incidence[subset]
+        self.uncovered_count -= int(np.count_nonzero(covered & (self.cover_counts == 0)))
+        self.cover_counts += covered
+
+    def remove(self, subset: int):
+        if not self.selected[subset]:
+            return
+        self.selected[subset] = False
+        covered = self.problem_instance.incidence[subset]
+        self.cover_counts -= covered
+        self.uncovered_count += int(np.count_nonzero(covered & (self.cover_counts == 0)))
+
+    def new_coverage_counts(self) -> np.ndarray:
+        """ Number of uncovered elements each subset would newly cover (0 for selected subsets). """
+        counts = self.problem_instance.incidence[:, self.cover_counts == 0].sum(axis=1)
+        counts[self.selected] = 0
+        return counts
+
+    def candidates(self) -> np.ndarray:
+        """ Unselected subsets that cover at least one uncovered element. """
+        hits = self.problem_instance.element_subsets[self.uncovered].any(axis=0)
+        return np.flatnonzero(hits & ~self.selected)
@@ -1,49 +1,164 @@
 from .scqbf_instance import *
 from .scqbf_solution import *
 from .scqbf_evaluator import *
+from .scqbf_cache import *
+from .scqbf_local_search import *
+from .scqbf_profiling import *
+from .scqbf_checkpoint import *
 import time
-import random
 from dataclasses import dataclass
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
 
-from typing import List, Literal
+from typing import List, Literal, Union
 
 
 # Type aliases:
-Chromosome = List[int]  # Example chromosome representation
+Chromosome = np.ndarray  # 0/1 uint8 vector of length n
 Population = List[Chromosome]
 
 
+_worker_instance: ScQbfInstance = None  # Instance shipped once to each process-pool worker
+
+def _init_repair_worker(instance: ScQbfInstance):
+    global _worker_instance
+    _worker_instance = instance
+
+def repair_chromosome(instance: ScQbfInstance, chromosome: np.ndarray, rng: np.random.Generator,
+                      strategy: str = "random", rcl_alpha: float = 0.3) -> int:
+    """
+    Make a chromosome feasible in place by adding subsets that cover something new, returning
+    how many were added. Candidates are chosen according to the repair strategy:
+
+    - "random": uniformly among subsets covering at least one uncovered element;
+    - "greedy_ratio": the subset with the best score combining its QBF insertion delta and the
+      number of elements it newly covers (delta * coverage^2 for gains, delta / coverage^2 for
+      losses, so the score grows with both);
+    - "random_restricted_candidate_list": uniformly among subsets whose score is within
+      rcl_alpha of the best, relative to the score range (GRASP-style RCL).
+
+    Each step scores all candidates with one pass over the incidence matrix and the
+    incremental insertion deltas.
+    """
+    if strategy not in ("random", "greedy_ratio", "random_restricted_candidate_list"):
+        raise ValueError(f"Unknown repair strategy: {strategy}")
+
+    elements = np.flatnonzero(chromosome)
+    tracker = ScQbfCoverageTracker(instance, elements)
+    state = ScQbfEvaluatedSolution(instance, elements) if strategy != "random" and not tracker.is_feasible() else None
+
+    added = 0
+    while not tracker.is_feasible():
+        if strategy == "random":
+            chosen = int(rng.choice(tracker.candidates()))
+        else:
+            new_coverage = tracker.new_coverage_counts()
+            candidates = np.flatnonzero(new_coverage)
+            delta, coverage = state.insertion_deltas()[candidates], new_coverage[candidates]
+            # Increasing in both delta and coverage: gains are scaled up and losses spread out by the
+            # squared coverage, weighted enough towards coverage to keep repairs short
+            ratio = np.where(delta > 0, delta * coverage ** 2, delta / coverage ** 2)
+            if strategy == "greedy_ratio":
+                chosen = int(candidates[np.argmax(ratio)])
+            else:
+                threshold = ratio.max() - rcl_alpha * (ratio.max() - ratio.min())
+                chosen = int(rng.choice(candidates[ratio >= threshold]))
+            state.insert(chosen)
+
+        chromosome[chosen] = 1
+        tracker.insert(chosen)
+        added += 1
+
+    return added
+
+def _repair_and_evaluate_chunk(chunk: np.ndarray, seed: np.random.SeedSequence, strategy: str, rcl_alpha: float,
+                               instance: ScQbfInstance = None) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Make every chromosome of a (c x n) chunk feasible with repair_chromosome and score the
+    chunk, also returning the number of repair steps. Each chunk draws from its own child
+    seed stream, so results do not depend on how chunks are scheduled across workers.
+    """
+    instance = instance if instance is not None else _worker_instance
+    rng = np.random.default_rng(seed)
+    repair_steps = 0
+    for chromosome in chunk:
+        repair_steps += repair_chromosome(instance, chromosome, rng, strategy, rcl_alpha)
+
+    return chunk, ScQbfEvaluator(instance).evaluate_objfun_batch(chunk), repair_steps
+
+
 @dataclass
 class GAStrategy:
     population_init: Literal["random", "latin_hypercube"] = "random"
     mutation_strategy: Literal["standard", "adaptive"] = "standard"
+    engine: Literal["standard", "vectorized"] = "standard"
+    adaptive_schedule: Literal["periodic", "entropy"] = "periodic"
+    adaptive_interval: int = 5  # generations between adjustments for the periodic schedule
+    local_search: Literal["none", "first_improvement", "best_improvement"] = "none"
+    local_search_target: Literal["elite", "offspring"] = "elite"
+    local_search_rate: float = 0.1  # fraction of the population improved by local search each generation
+    local_search_max_moves: int = None  # moves per local search call (None: until a local optimum)
+    repair_strategy: Literal["random", "greedy_ratio", "random_restricted_candidate_list"] = "random"
+    repair_rcl_alpha: float = 0.3  # RCL width for the random_restricted_candidate_list repair
+    generation_model: Literal["generational", "steady_state"] = "generational"
+    steady_state_replacements: int = 2  # offspring per steady-state step (rounded up to an even number)
 class ScQbfGA:
     
     def __init__(self, instance: ScQbfInstance, population_size: int = 100, mutation_rate_multiplier: int = 1,
-                 ga_strategy: GAStrategy = GAStrategy(), termination_options: dict = {}, debug_options: dict = {}):
+                 ga_strategy: GAStrategy = GAStrategy(), termination_options: dict = {}, debug_options: dict = {},
+                 cache_options: dict = {}, parallel_options: dict = {}, checkpoint_options: dict = {},
+                 seed: Union[int, np.random.SeedSequence] = None):
         # GA related properties
         self.instance = instance
         self.evaluator = ScQbfEvaluator(instance)
         self.population: Population = []
+        self.population_fitness: np.ndarray = np.empty(0)
         self.best_chromosome: Chromosome = None
         self.best_solution: ScQbfSolution = None
+        self.best_fitness: float = -np.inf
         self.population_size = population_size
         self.mutation_rate_multiplier = mutation_rate_multiplier
 
         self.ga_strategy = ga_strategy
+        if ga_strategy.adaptive_interval < 1:
+            raise ValueError(f"Adaptive interval must be positive, got {ga_strategy.adaptive_interval}.")
+        # Every stochastic operator draws from this generator; child streams for parallel
+        # workers are spawned from the same seed sequence, so a seed fixes the whole run.
+        self.seed = seed
+        self._seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(self._seed_sequence)
+        self._local_search = None
+        if ga_strategy.local_search != "none":
+            self._local_search = ScQbfLocalSearch(instance, ga_strategy.local_search,
+                                                  max_moves=ga_strategy.local_search_max_moves, rng=self._rng)
+            self._local_optima = ScQbfFitnessCache(max_size=10_000)  # chromosomes known to be local optima
         self.debug_options = debug_options
         self.termination_options = termination_options
-        self._cache = {}
+        self.cache = ScQbfFitnessCache(max_size=cache_options.get("max_size", 50_000),
+                                       store_elements=cache_options.get("store_elements", False))
+        self.parallel_options = parallel_options
+        if parallel_options.get("backend") is not None and ga_strategy.engine != "vectorized":
+            # The standard engine repairs each child inline during crossover and mutation
+            raise ValueError(f"Parallel backend {parallel_options['backend']!r} requires the vectorized engine, "
+                             f"got engine {ga_strategy.engine!r}.")
+        self._executor = None
+        self._profiler = ScQbfProfiler(enabled=debug_options.get("profile", False))
+        self.checkpoint_options = checkpoint_options
+        self._checkpoint_signals = None
         
         # Internal properties for managing execution and termination criteria
         self._start_time = None                         # Start time of the algorithm
         self.execution_time = 0.0                       # Total execution time
         self._iter = 0                                  # Current iteration
+        self._completed_generations = 0                 # Generations fully run (for the stats snapshot)
         self._no_improvement_iter = 0                   # Iterations since last improvement
-        self._prev_best_solution = None                 # Previous best solution to track improvements
+        self._prev_best_fitness = None                  # Best fitness at the previous iteration, to track improvements
         self.stop_reason = None                         # Reason for stopping the algorithm (e.g., max_iter, time_limit, etc.)
         self.history: list[tuple[float, float]] = []    # History of best and current solutions' objective values
+        self._allele_freq_iter = None                   # Iteration the cached allele frequencies belong to
+        self._allele_freq: np.ndarray = None            # Per-locus frequency of 1s in the current population
+        self._mutation_rate_iter = None                 # Iteration the adaptive mutation rate was last adjusted in
         
 
     def _eval_termination_condition(self) -> bool:
@@ -65,69 +180,356 @@ class ScQbfGA:
             if self._no_improvement_iter > patience:
                 self.stop_reason = "patience_exceeded"
                 return True
-            elif self.best_solution is not None and self._prev_best_solution is not None:
-                if self.evaluator.evaluate_objfun(self.best_solution) <= self.evaluator.evaluate_objfun(self._prev_best_solution):
+            elif self.best_solution is not None and self._prev_best_fitness is not None:
+                if self.best_fitness <= self._prev_best_fitness:
                     self._no_improvement_iter += 1
                 else:
                     self._no_improvement_iter = 0
 
-        self._prev_best_solution = self.best_solution
+        self._prev_best_fitness = self.best_fitness if self.best_solution is not None else None
 
         return False
     
     def _perform_debug_actions(self):
         """ Perform debug actions, such as logging or printing debug information. """
         if self.debug_options.get("verbose", False):
-            print(f"Iteration {self._iter}: Best fitness = {f'{self.evaluator.evaluate_objfun(self.best_solution):.2f}' if self.best_solution else 'N/A'}")
+            print(f"Iteration {self._iter}: Best fitness = {f'{self.best_fitness:.2f}' if self.best_solution else 'N/A'}")
 
         if self.debug_options.get("save_history", False):
-            self.history.append((self.evaluator.evaluate_objfun(self.best_solution) if self.best_solution else 0))
+            self.history.append((self.best_fitness if self.best_solution else 0))
         
         if self.debug_options.get("save_mrate_history", False):
             if not hasattr(self, 'mutation_rate_history'):
                 self.mutation_rate_history = []
                 self.diversity_history = []
             self.mutation_rate_history.append(self.mutation_rate_multiplier)
-            self.diversity_history.append(self._get_diversity(self.population))
+            self.diversity_history.append(self._get_generation_diversity())
 
-    def solve(self) -> ScQbfSolution:
-        """ Main method to solve the problem using a genetic algorithm. """
-        self._initialize_population()
-        
-        self._start_time = time.time()
-        self._iter = 0
-        while not self._eval_termination_condition():
-            self._perform_debug_actions()
-            
-            parents = self._select_parents()
-            offspring = self._crossover(parents)
-            offspring = self._mutate(offspring)
-            self.population = self._select_population(offspring)
-
-            for chromosome in self.population:
-                solution, fitness = self._cached_decode_and_eval(chromosome)
-                if self.best_solution is None or fitness > self.evaluator.evaluate_objfun(self.best_solution):
-                    self.best_solution = solution
-                    self.best_chromosome = chromosome
+        stats_callback = self.debug_options.get("stats_callback", None)
+        if stats_callback is not None:
+            stats_callback(self.stats)
+
+    @property
+    def stats(self) -> ScQbfGAStats:
+        """
+        Instrumentation snapshot: per-phase timers (collected when debug_options["profile"] is set),
+        evaluation and repair counters, and the cache hit rate.
+        """
+        elapsed_time = time.time() - self._start_time if self._start_time is not None else 0.0
+        return self._profiler.snapshot(self._completed_generations, elapsed_time, self.cache.hit_rate)
+
+    def solve(self, resume_from: str = None) -> ScQbfSolution:
+        """
+        Main method to solve the problem using a genetic algorithm.
+        If resume_from is the path of a checkpoint, the search continues from that snapshot instead of a new population.
+        """
+        if resume_from is None:
+            self._initialize_search()
+            self._start_time = time.time()
+            self._iter = 0
+            self._completed_generations = 0
+        else:
+            self.load_checkpoint(resume_from)
+
+        self._checkpoint_signals = ScQbfCheckpointSignals(
+            save_signals=self.checkpoint_options.get("save_signals", ("SIGUSR1",)),
+            stop_signals=self.checkpoint_options.get("stop_signals", ("SIGTERM",)),
+        ) if self.checkpoint_options.get("path") is not None else None
+
+        try:
+            with self._checkpoint_signals or nullcontext():
+                while not self._eval_termination_condition():
+                    self._perform_debug_actions()
+                    self._run_generation()
+                    if self._perform_checkpoint_actions():
+                        self.stop_reason = "signal"
+                        break
+        finally:
+            self._checkpoint_signals = None
+            self._shutdown_executor()
     
         return self.best_solution
+
+    def _perform_checkpoint_actions(self) -> bool:
+        """ Write a checkpoint if one is due (periodic or signalled); returns True if a signal asked the search to stop. """
+        path = self.checkpoint_options.get("path", None)
+        if path is None:
+            return False
+
+        interval = self.checkpoint_options.get("interval", None)
+        signals = self._checkpoint_signals
+        if (interval is not None and self._iter % interval == 0) or (signals is not None and signals.save_requested):
+            self.save_checkpoint(path)
+            if signals is not None:
+                signals.save_requested = False
+
+        return signals is not None and signals.stop_requested
+
+    def save_checkpoint(self, path: str):
+        """
+        Snapshot the search state at a generation boundary: the bit-packed population and its fitness,
+        the best chromosome, iteration and patience counters, the adaptive mutation rate, the RNG and
+        seed sequence state, the elapsed time, the fitness cache in LRU order and, with local search,
+        the known local optima (so they are not searched again). The cache is saved because a batched
+        evaluation may round differently from the one that filled it, so refilling it on resume could
+        change the fitness values, and with them the rest of the run.
+        """
+        population = np.asarray(self.population, dtype=np.uint8)
+        arrays = {
+            'population': np.packbits(population, axis=1),
+            'population_fitness': self.population_fitness,
+            'best_chromosome': np.packbits(self.best_chromosome),
+            **self._cache_arrays(self.cache, 'cache'),
+        }
+        if self._local_search is not None:
+            arrays.update(self._cache_arrays(self._local_optima, 'local_optima'))
+
+        metadata = {
+            'n': self.instance.n,
+            'iter': self._iter,
+            'no_improvement_iter': self._no_improvement_iter,
+            'best_fitness': float(self.best_fitness),
+            'prev_best_fitness': self._prev_best_fitness,
+            'mutation_rate_multiplier': self.mutation_rate_multiplier,
+            'original_mutation_rate_multiplier': getattr(self, 'original_mutation_rate_multiplier', None),
+            'rng_state': self._rng.bit_generator.state,
+            'seed_sequence': {
+                'entropy': self._seed_sequence.entropy,
+                'spawn_key': list(self._seed_sequence.spawn_key),
+                'pool_size': self._seed_sequence.pool_size,
+                'n_children_spawned': self._seed_sequence.n_children_spawned,
+            },
+            'elapsed_time': time.time() - self._start_time,
+            'history': self.history,
+        }
+        write_checkpoint(path, arrays, metadata)
+
+    def _cache_arrays(self, cache: ScQbfFitnessCache, prefix: str) -> dict:
+        """ A fitness cache as a (size x ceil(n / 8)) key matrix and a fitness vector, least recently used first. """
+        items = cache.items()
+        key_size = (self.instance.n + 7) // 8
+        return {
+            f'{prefix}_keys': np.frombuffer(b"".join(key for key, _ in items), dtype=np.uint8).reshape(-1, key_size),
+            f'{prefix}_fitness': np.array([fitness for _, fitness in items], dtype=np.float64),
+        }
+
+    def load_checkpoint(self, path: str):
+        """ Restore the search state saved by save_checkpoint, so that solve(resume_from=path) continues the run. """
+        arrays, metadata = read_checkpoint(path)
+        n = self.instance.n
+        if metadata['n'] != n:
+            raise ValueError(f"Checkpoint {path} is for an instance with n={metadata['n']}, not n={n}.")
+
+        population = np.unpackbits(arrays['population'], axis=1, count=n)
+        if len(population) != self.population_size:
+            raise ValueError(f"Checkpoint {path} has a population of {len(population)}, not {self.population_size}.")
+
+        self.population = population if self.ga_strategy.engine == "vectorized" else list(population)
+        self.population_fitness = arrays['population_fitness'].astype(np.float64)
+        for packed, fitness in zip(arrays['cache_keys'], arrays['cache_fitness']):
+            self.cache.put(packed.tobytes(), float(fitness),
+                           np.flatnonzero(np.unpackbits(packed, count=n)) if self.cache.store_elements else None)
+
+        if self._local_search is not None and 'local_optima_keys' in arrays:
+            for packed, fitness in zip(arrays['local_optima_keys'], arrays['local_optima_fitness']):
+                self._local_optima.put(packed.tobytes(), float(fitness))
+
+        self.best_chromosome = np.unpackbits(arrays['best_chromosome'], count=n)
+        self.best_fitness = metadata['best_fitness']
+        self.best_solution = self.decode(self.best_chromosome)
+        self.best_solution._objfun_val = self.best_fitness
+        self._prev_best_fitness = metadata['prev_best_fitness']
+
+        self._iter = metadata['iter']
+        self._completed_generations = metadata['iter']  # checkpoints are written right after a generation
+        self._no_improvement_iter = metadata['no_improvement_iter']
+        self.mutation_rate_multiplier = metadata['mutation_rate_multiplier']
+        if metadata['original_mutation_rate_multiplier'] is not None:
+            self.original_mutation_rate_multiplier = metadata['original_mutation_rate_multiplier']
+        self._allele_freq_iter = None
+        self._mutation_rate_iter = None
+
+        # Restore the generator in place: the local search shares it
+        self._rng.bit_generator.state = metadata['rng_state']
+        seed_sequence = metadata['seed_sequence']
+        self._seed_sequence = np.random.SeedSequence(seed_sequence['entropy'], spawn_key=tuple(seed_sequence['spawn_key']),
+                                                     pool_size=seed_sequence['pool_size'],
+                                                     n_children_spawned=seed_sequence['n_children_spawned'])
+
+        self.history = list(metadata['history'])
+        self._start_time = time.time() - metadata['elapsed_time']
+        self.execution_time = metadata['elapsed_time']
+
+    def _initialize_search(self):
+        """ Build and score the initial population. """
+        self._initialize_population()
+        if self.ga_strategy.engine == "vectorized":
+            self.population = np.array(self.population, dtype=np.uint8)
+        self.population_fitness = self._evaluate_population(self.population)
+        self._update_best()
+
+    def _run_generation(self):
+        """
+        Evolve the population by one generation and update the best solution found.
+        A steady-state generation runs replacement steps until population_size offspring have been
+        produced, so iteration-based termination and adaptation are comparable between both models.
+        """
+        profiler = self._profiler
+        if self.ga_strategy.generation_model == "generational":
+            offspring, offspring_fitness = self._produce_offspring(self.population_size)
+            with profiler.phase("select_population"):
+                self.population, self.population_fitness = self._select_population(offspring, offspring_fitness)
+        elif self.ga_strategy.generation_model == "steady_state":
+            replacements = self.ga_strategy.steady_state_replacements
+            if not 1 <= replacements <= self.population_size:
+                raise ValueError(f"Steady-state replacements must be between 1 and the population size, got {replacements}.")
+
+            count = replacements + replacements % 2
+            for _ in range(-(-self.population_size // count)):
+                offspring, offspring_fitness = self._produce_offspring(count)
+                with profiler.phase("select_population"):
+                    self._replace_worst(offspring, offspring_fitness)
+        else:
+            raise ValueError(f"Unknown generation model: {self.ga_strategy.generation_model}")
+
+        with profiler.phase("local_search"):
+            self._apply_local_search()
+        self._update_best()
+        self._completed_generations += 1
+
+    def _produce_offspring(self, count: int) -> tuple[Population, np.ndarray]:
+        """
+        Select count parents and return their feasible offspring, using the strategy's engine,
+        with their fitness when already known (parallel repair) or None.
+        """
+        profiler = self._profiler
+        offspring_fitness = None
+        if self.ga_strategy.engine == "standard":
+            with profiler.phase("select_parents"):
+                parents = self._select_parents(count)
+            with profiler.phase("crossover"):
+                offspring = self._crossover(parents)
+            with profiler.phase("mutate"):
+                offspring = self._mutate(offspring)
+        elif self.ga_strategy.engine == "vectorized":
+            with profiler.phase("select_parents"):
+                parents = self._select_parents_vectorized(count)
+            with profiler.phase("crossover"):
+                offspring = self._crossover_vectorized(parents)
+            with profiler.phase("mutate"):
+                offspring = self._mutate(offspring)
+            with profiler.phase("repair_and_evaluate"):
+                offspring_fitness = self._repair_and_evaluate_offspring(offspring)
+        else:
+            raise ValueError(f"Unknown GA engine: {self.ga_strategy.engine}")
+
+        profiler.count_repair(0, chromosomes=len(offspring))
+        return offspring, offspring_fitness
+
+    def _replace_worst(self, offspring: Population, offspring_fitness: np.ndarray = None):
+        """
+        Steady-state replacement: the offspring replace the worst individuals they improve on,
+        pairing the best offspring with the worst individual, so the population keeps the best
+        len(offspring) of the worst individuals and the offspring. Only the offspring are scored,
+        unless their fitness is given.
+        """
+        if offspring_fitness is None:
+            offspring_fitness = self._evaluate_population(offspring)
+        order = np.argsort(offspring_fitness)[::-1]
+        worst = np.argsort(self.population_fitness)[:len(offspring)]
+        better = offspring_fitness[order] > self.population_fitness[worst]
+
+        for i, j in zip(worst[better], order[better]):
+            self.population[i] = offspring[j]
+        self.population_fitness[worst[better]] = offspring_fitness[order[better]]
+
+    def _apply_local_search(self):
+        """
+        Memetic step: improve the elite or a random sample of the new population with local search,
+        writing the improved chromosomes and fitness values back in place.
+        """
+        if self._local_search is None:
+            return
+
+        count = max(1, int(round(self.ga_strategy.local_search_rate * len(self.population))))
+        if self.ga_strategy.local_search_target == "elite":
+            targets = np.argsort(self.population_fitness)[::-1][:count]
+        elif self.ga_strategy.local_search_target == "offspring":
+            targets = self._rng.choice(len(self.population), size=count, replace=False)
+        else:
+            raise ValueError(f"Unknown local search target: {self.ga_strategy.local_search_target}")
+
+        for i in targets:
+            if self._chromosome_key(self.population[i]) in self._local_optima:
+                continue
+
+            chromosome, fitness, local_optimum = self._local_search.improve(np.array(self.population[i], dtype=np.uint8))
+            key = self._chromosome_key(chromosome)
+            if local_optimum:
+                self._local_optima.put(key, fitness)
+            self.cache.put(key, fitness, np.flatnonzero(chromosome) if self.cache.store_elements else None)
+            self.population[i] = chromosome
+            self.population_fitness[i] = fitness
+
+    def _update_best(self):
+        """ Track the best chromosome of the current population if it improves on the incumbent. """
+        best_idx = int(np.argmax(self.population_fitness))
+        if self.best_solution is None or self.population_fitness[best_idx] > self.best_fitness:
+            self.best_chromosome = self.population[best_idx].copy()
+            self.best_fitness = float(self.population_fitness[best_idx])
+            self.best_solution = self.decode(self.best_chromosome)
+            self.best_solution._objfun_val = self.best_fitness
         
+    def _get_elite(self, count: int) -> np.ndarray:
+        """ The count fittest chromosomes of the current population, as a (count x n) matrix. """
+        elite_idx = np.argsort(self.population_fitness)[::-1][:count]
+        return np.array([self.population[i] for i in elite_idx], dtype=np.uint8)
+
+    def _receive_migrants(self, migrants: np.ndarray):
+        """ Replace the worst individuals of the current population with (feasible) migrant chromosomes. """
+        if len(migrants) == 0:
+            return
+
+        migrant_fitness = self._evaluate_population(migrants)
+        worst_idx = np.argsort(self.population_fitness)[:len(migrants)]
+        for i, migrant in zip(worst_idx, migrants):
+            self.population[i] = migrant.copy()
+        self.population_fitness[worst_idx] = migrant_fitness[:len(worst_idx)]
+        self._update_best()
+
     def decode(self, chromosome: Chromosome) -> ScQbfSolution:
         """ Decode a chromosome into a ScQbfSolution. """
-        solution = ScQbfSolution([])
-        for i in range(len(chromosome)):
-            if chromosome[i] == 1:
-                solution.elements.append(i)
+        return ScQbfSolution(np.flatnonzero(chromosome).tolist())
+
+    @staticmethod
+    def _chromosome_key(chromosome: Chromosome) -> bytes:
+        """ Compact hashable cache key: the chromosome bit-packed into ceil(n / 8) bytes. """
+        return np.packbits(chromosome).tobytes()
+
+    def _evaluate_population(self, population: Population) -> np.ndarray:
+        """ Fitness of every chromosome in the population, scoring all cache misses in one batched call. """
+        X = np.asarray(population)
+        keys = [row.tobytes() for row in np.packbits(X, axis=1)]
+        fitness = np.empty(len(keys))
+        misses = {}
+        for i, key in enumerate(keys):
+            entry = self.cache.get(key)
+            if entry is None:
+                misses.setdefault(key, []).append(i)
+            else:
+                fitness[i] = entry[0]
 
-        return solution
+        if misses:
+            first = [indices[0] for indices in misses.values()]
+            with self._profiler.phase("evaluate"):
+                values = self.evaluator.evaluate_objfun_batch(X[first])
+            self._profiler.count_evaluations(len(first))
+            for (key, indices), value in zip(misses.items(), values):
+                fitness[indices] = value
+                elements = np.flatnonzero(X[indices[0]]) if self.cache.store_elements else None
+                self.cache.put(key, float(value), elements)
 
-    def _cached_decode_and_eval(self, chromosome: Chromosome) -> tuple[ScQbfSolution, float]:
-        key = tuple(chromosome)  # O(n) to create tuple
-        if key not in self._cache:  # O(1) average lookup
-            solution = self.decode(chromosome)
-            fitness = self.evaluator.evaluate_objfun(solution)
-            self._cache[key] = (solution, fitness)  # O(1) average insertion
-        return self._cache[key]
+        return fitness
 
     def _initialize_population(self):
         if self.ga_strategy.population_init == "random":
@@ -140,81 +542,153 @@ class ScQbfGA:
     def _initialize_population_random(self):
         self.population = []
         for _ in range(self.population_size):
-            chromosome = [0] * self.instance.n
-            num_ones = random.randint(1, self.instance.n)
-            ones_indices = random.sample(range(self.instance.n), num_ones)
-            for idx in ones_indices:
-                chromosome[idx] = 1
-            chromosome = self._make_feasible(chromosome)
+            chromosome = np.zeros(self.instance.n, dtype=np.uint8)
+            num_ones = self._rng.integers(1, self.instance.n + 1)
+            chromosome[self._rng.choice(self.instance.n, size=num_ones, replace=False)] = 1
+            chromosome = self._make_feasible(chromosome, count_steps=False)
             self.population.append(chromosome)
 
     def _initialize_population_latin_hypercube(self):
         if self.population_size % 2 != 0:
             raise ValueError("Population size must be a multiple of the allele count (here, 2) for Latin Hypercube Sampling.")
         
-        self.population = []
-        
-        for i in range(self.population_size):
-            chromosome = [0] * self.instance.n
-            self.population.append(chromosome)
+        population = np.zeros((self.population_size, self.instance.n), dtype=np.uint8)
         
         # For each gene position (column), create a random permutation
         for gene_pos in range(self.instance.n):
             # Create permutation of population indices [0, 1, 2, ..., population_size-1]
-            permutation = list(range(self.population_size))
-            random.shuffle(permutation)
+            permutation = self._rng.permutation(self.population_size)
             
             # Assign alleles based on permutation index modulo 2
-            for pop_idx in range(self.population_size):
-                allele = permutation[pop_idx] % 2
-                self.population[pop_idx][gene_pos] = allele
+            population[:, gene_pos] = permutation % 2
         
         # fix feasibility
-        for i in range(len(self.population)):
-            self.population[i] = self._make_feasible(self.population[i])
+        self.population = [self._make_feasible(chromosome, count_steps=False) for chromosome in population]
 
-    def _make_feasible(self, chromosome: Chromosome) -> Chromosome:
+    def _make_feasible(self, chromosome: Chromosome, count_steps: bool = True) -> Chromosome:
         """
-        If the chromosome is not feasible, add random elements that improve coverage until it becomes feasible.
+        If the chromosome is not feasible, add elements that improve coverage until it becomes feasible,
+        chosen according to the strategy's repair_strategy. The added subsets count towards the
+        offspring repair statistics unless count_steps is False (initial population); the offspring
+        themselves are counted once, in _produce_offspring.
         """
-        
-        decoded_solution, _ = self._cached_decode_and_eval(chromosome)
-        while not self.evaluator.is_solution_feasible(decoded_solution):
-            cl = [i for i in range(self.instance.n) if chromosome[i] == 0 and self.evaluator.evaluate_insertion_delta_coverage(i, decoded_solution) > 0]
-            chosen = random.choice(cl)
-            chromosome[chosen] = 1
-            decoded_solution.elements.append(chosen)
-            
+        with self._profiler.phase("make_feasible"):
+            steps = repair_chromosome(self.instance, chromosome, self._rng,
+                                      self.ga_strategy.repair_strategy, self.ga_strategy.repair_rcl_alpha)
+        if count_steps:
+            self._profiler.count_repair(steps, chromosomes=0)
         return chromosome
 
-    def _select_parents(self) -> Population:
+    def _get_executor(self):
+        """ Lazily start the worker pool configured in parallel_options (None for serial execution). """
+        backend = self.parallel_options.get("backend", None)
+        if backend is None or self._executor is not None:
+            return self._executor
+
+        workers = self.parallel_options.get("workers", None)
+        if backend == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=workers)
+        elif backend == "process":
+            self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_repair_worker,
+                                                 initargs=(self.instance,))
+        else:
+            raise ValueError(f"Unknown parallel backend: {backend}")
+        return self._executor
+
+    def _shutdown_executor(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _repair_and_evaluate_offspring(self, offspring: np.ndarray) -> np.ndarray:
+        """
+        Repair a (P x n) offspring matrix in place. Without a parallel backend the offspring are
+        only repaired and None is returned, leaving scoring to the selection step. With one,
+        offspring already in the cache (hence feasible) keep their cached fitness, and only the
+        misses are split into chunks of parallel_options["chunk_size"] that the worker pool
+        repairs and scores; the fitness of every offspring is returned.
+        """
+        executor = self._get_executor()
+        if executor is None:
+            for chromosome in offspring:
+                self._make_feasible(chromosome)
+            return None
+
+        fitness = np.empty(len(offspring))
+        misses = []
+        for i, key in enumerate(row.tobytes() for row in np.packbits(offspring, axis=1)):
+            entry = self.cache.get(key)
+            if entry is None:
+                misses.append(i)
+            else:
+                fitness[i] = entry[0]
+        if not misses:
+            return fitness
+
+        misses = np.array(misses)
+        chunk_size = self.parallel_options.get("chunk_size", 16)
+        chunks = [misses[start:start + chunk_size] for start in range(0, len(misses), chunk_size)]
+        seeds = self._seed_sequence.spawn(len(chunks))
+
+        repair_args = (self.ga_strategy.repair_strategy, self.ga_strategy.repair_rcl_alpha)
+        if self.parallel_options.get("backend") == "thread":
+            futures = [executor.submit(_repair_and_evaluate_chunk, offspring[rows], seed, *repair_args, self.instance)
+                       for rows, seed in zip(chunks, seeds)]
+        else:
+            futures = [executor.submit(_repair_and_evaluate_chunk, offspring[rows], seed, *repair_args)
+                       for rows, seed in zip(chunks, seeds)]
+
+        for rows, future in zip(chunks, futures):
+            chunk, chunk_fitness, repair_steps = future.result()
+            self._profiler.count_repair(repair_steps, chromosomes=0)
+            self._profiler.count_evaluations(len(chunk))
+            offspring[rows] = chunk
+            fitness[rows] = chunk_fitness
+            for chromosome, value in zip(chunk, chunk_fitness):
+                elements = np.flatnonzero(chromosome) if self.cache.store_elements else None
+                self.cache.put(self._chromosome_key(chromosome), float(value), elements)
+
+        return fitness
+
+    def _select_parents(self, count: int = None) -> Population:
         """ Tournament selection implementation."""
+        count = self.population_size if count is None else count
         parents: Population = []
         
-        while len(parents) < self.population_size:
-            tournament = random.sample(self.population, 2)
-            tournament_fitness = [self._cached_decode_and_eval(chrom)[1] for chrom in tournament]
-            winner = tournament[tournament_fitness.index(max(tournament_fitness))]
+        while len(parents) < count:
+            tournament = self._rng.choice(len(self.population), size=2, replace=False)
+            tournament_fitness = self.population_fitness[tournament]
+            winner = self.population[tournament[int(np.argmax(tournament_fitness))]]
             parents.append(winner)
         
         return parents
+
+    def _select_parents_vectorized(self, count: int = None) -> np.ndarray:
+        """ Binary tournament selection of count parents (default: the population size) from one batch of random draws. """
+        count = self.population_size if count is None else count
+        P = len(self.population)
+        first = self._rng.integers(0, P, size=count)
+        second = (first + self._rng.integers(1, P, size=count)) % P  # distinct opponent
+
+        winners = np.where(self.population_fitness[first] >= self.population_fitness[second], first, second)
+        return self.population[winners]
     
     def _crossover(self, parents: Population) -> Population:
         """
         Two-point crossover implementation.
+        The segment between the cut points is swapped with a single XOR mask over the parents.
         """
         offspring: Population = []
         
         for i in range(0, len(parents), 2):
             parent1, parent2 = parents[i], parents[i + 1]
             
-            point1, point2 = sorted([
-                random.randint(0, self.instance.n - 1),
-                random.randint(0, self.instance.n - 1)
-            ])
+            point1, point2 = np.sort(self._rng.integers(0, self.instance.n, size=2))
             
-            offspring1 = parent1[:point1] + parent2[point1:point2] + parent1[point2:]
-            offspring2 = parent2[:point1] + parent1[point1:point2] + parent2[point2:]
+            swap = np.zeros(self.instance.n, dtype=np.uint8)
+            swap[point1:point2] = parent1[point1:point2] ^ parent2[point1:point2]
+            offspring1 = parent1 ^ swap
+            offspring2 = parent2 ^ swap
 
             offspring1 = self._make_feasible(offspring1)
             offspring2 = self._make_feasible(offspring2)
@@ -222,10 +696,30 @@ class ScQbfGA:
             offspring.extend([offspring1, offspring2])
         
         return offspring
+
+    def _crossover_vectorized(self, parents: np.ndarray) -> np.ndarray:
+        """
+        Two-point crossover over consecutive parent pairs of a (P x n) matrix.
+        Cut points are drawn in one batch and turned into per-pair segment masks; an odd
+        last parent is carried over unchanged. Offspring are repaired after mutation.
+        """
+        n = self.instance.n
+        pairs = len(parents) // 2
+        parents1, parents2 = parents[0:2 * pairs:2], parents[1:2 * pairs:2]
+
+        cuts = np.sort(self._rng.integers(0, n, size=(pairs, 2)), axis=1)
+        loci = np.arange(n)
+        mask = (loci >= cuts[:, :1]) & (loci < cuts[:, 1:])
+        swap = (parents1 ^ parents2) & mask
+
+        offspring = parents.copy()
+        offspring[0:2 * pairs:2] = parents1 ^ swap
+        offspring[1:2 * pairs:2] = parents2 ^ swap
+        return offspring
     
     def _mutate(self, offspring: Population) -> Population:
         if self.ga_strategy.mutation_strategy == "standard":
-            return self._mutate_standard(offspring)
+            return self._apply_mutation(offspring)
         elif self.ga_strategy.mutation_strategy == "adaptive":
             return self._mutate_adaptive(offspring)
         else:
@@ -235,59 +729,105 @@ class ScQbfGA:
         """ Standard bit-flip mutation implementation using Poisson distribution."""
         for chromosome in offspring:
             lambda_param = self.mutation_rate_multiplier # expected number of mutations per chromosome
-            num_mutations = np.random.poisson(lam=lambda_param)
+            num_mutations = self._rng.poisson(lam=lambda_param)
             
             if num_mutations > 0:
                 num_mutations = min(num_mutations, self.instance.n)  # Cap at chromosome length
-                mutation_loci = random.sample(range(self.instance.n), num_mutations)
+                mutation_loci = self._rng.choice(self.instance.n, size=num_mutations, replace=False)
                 
-                # Flip bits at selected loci
-                for locus in mutation_loci:
-                    chromosome[locus] = 1 - chromosome[locus]
+                # Flip bits at selected loci with an XOR mask
+                mask = np.zeros(self.instance.n, dtype=np.uint8)
+                mask[mutation_loci] = 1
+                chromosome ^= mask
             
             chromosome = self._make_feasible(chromosome)
         
         return offspring
+
+    def _mutate_vectorized(self, offspring: np.ndarray) -> np.ndarray:
+        """
+        Standard bit-flip mutation for a (P x n) matrix: Poisson mutation counts for all
+        chromosomes in one draw, and a mask flipping that many distinct random loci per row.
+        """
+        P, n = offspring.shape
+        num_mutations = np.minimum(self._rng.poisson(lam=self.mutation_rate_multiplier, size=P), n)
+
+        # The loci holding each row's num_mutations smallest random keys are flipped
+        keys = self._rng.random((P, n))
+        kth_key = np.take_along_axis(np.sort(keys, axis=1), np.maximum(num_mutations - 1, 0)[:, None], axis=1)
+        mask = (keys <= kth_key) & (num_mutations[:, None] > 0)
+
+        offspring ^= mask.astype(np.uint8)
+        return offspring
+
+    def _apply_mutation(self, offspring: Population) -> Population:
+        if self.ga_strategy.engine == "vectorized":
+            return self._mutate_vectorized(offspring)
+        return self._mutate_standard(offspring)
     
     def _mutate_adaptive(self, offspring: Population) -> Population:
         if not hasattr(self, 'original_mutation_rate_multiplier'):
             self.original_mutation_rate_multiplier = self.mutation_rate_multiplier
+
+        # Adjust at most once per iteration: steady-state generations mutate several batches
+        if self._mutation_rate_iter == self._iter:
+            return self._apply_mutation(offspring)
+        self._mutation_rate_iter = self._iter
         
-        if self._iter % 5 == 0:  # Adjust every 5 iterations
-            if self._get_diversity(offspring) < 0.2:
-                self.mutation_rate_multiplier = min(self.original_mutation_rate_multiplier + 2, self.mutation_rate_multiplier + 0.25)
-            elif self._get_diversity(offspring) > 0.5:
-                self.mutation_rate_multiplier = max(min(self.original_mutation_rate_multiplier - 2, 0.25), self.mutation_rate_multiplier - 0.25)
-
-            if self.debug_options.get("verbose", False):
-                print(f"Adaptive mutation rate multiplier adjusted to: {self.mutation_rate_multiplier}")
+        if self.ga_strategy.adaptive_schedule == "periodic":
+            if self._iter % self.ga_strategy.adaptive_interval == 0:
+                diversity = self._get_generation_diversity()
+                if diversity < 0.2:
+                    self.mutation_rate_multiplier = min(self.original_mutation_rate_multiplier + 2, self.mutation_rate_multiplier + 0.25)
+                elif diversity > 0.5:
+                    self.mutation_rate_multiplier = max(self.original_mutation_rate_multiplier - 2, 0.25, self.mutation_rate_multiplier - 0.25)
+
+                if self.debug_options.get("verbose", False):
+                    print(f"Adaptive mutation rate multiplier adjusted to: {self.mutation_rate_multiplier}")
+        elif self.ga_strategy.adaptive_schedule == "entropy":
+            # Every generation, interpolate between the rate bounds: low entropy -> high mutation rate
+            high = self.original_mutation_rate_multiplier + 2
+            low = max(self.original_mutation_rate_multiplier - 2, 0.25)
+            self.mutation_rate_multiplier = high - (high - low) * self._get_generation_entropy()
+        else:
+            raise ValueError(f"Unknown adaptive schedule: {self.ga_strategy.adaptive_schedule}")
         
-        return self._mutate_standard(offspring)
+        return self._apply_mutation(offspring)
     
-    def _get_diversity(self, population: Population) -> float:
-        ''' Calculates the normalized diversity of the population.'''
-        P = len(population)
-
-        diversity_sum = 0.0
-        for locus in range(self.instance.n):
-            ones = sum(ch[locus] for ch in population)  # count of 1s at locus
-            p = ones / P
-            diversity_sum += p * (1 - p)
-        
-        return (diversity_sum / (0.25 * self.instance.n))
+    def _diversity_from_frequencies(self, p: np.ndarray) -> float:
+        ''' Normalized diversity of a population from its per-locus frequencies of 1s. '''
+        return float(np.sum(p * (1 - p)) / (0.25 * self.instance.n))
 
-    def _select_population(self, offspring: Population) -> Population:
-        """Elitist selection implementation. replace worst single offspring with best from previous generation."""
-        worst_chromosome = min(offspring, 
-                            key=lambda chrom: self._cached_decode_and_eval(chrom)[1])
+    def _get_generation_allele_frequencies(self) -> np.ndarray:
+        ''' Per-locus frequency of 1s in the current population, computed once per generation. '''
+        if self._allele_freq_iter != self._iter:
+            with self._profiler.phase("diversity"):
+                self._allele_freq = np.asarray(self.population).mean(axis=0)
+            self._allele_freq_iter = self._iter
+        return self._allele_freq
+
+    def _get_generation_diversity(self) -> float:
+        ''' Normalized diversity of the current population, shared by all consumers in a generation. '''
+        return self._diversity_from_frequencies(self._get_generation_allele_frequencies())
+
+    def _get_generation_entropy(self) -> float:
+        ''' Mean per-locus binary entropy (in bits, 0 to 1) of the current population. '''
+        p = np.clip(self._get_generation_allele_frequencies(), 1e-12, 1 - 1e-12)
+        return float(np.mean(-p * np.log2(p) - (1 - p) * np.log2(1 - p)))
+
+    def _select_population(self, offspring: Population, offspring_fitness: np.ndarray = None) -> tuple[Population, np.ndarray]:
+        """
+        Elitist selection implementation. replace worst single offspring with best from previous generation.
+        Offspring are scored unless their fitness is given; returns the new population with its fitness.
+        """
+        if offspring_fitness is None:
+            offspring_fitness = self._evaluate_population(offspring)
+        worst_index = int(np.argmin(offspring_fitness))
         
         # Only replace if the worst offspring is worse than the best from previous generation
-        if (self.best_chromosome is not None and 
-            self._cached_decode_and_eval(worst_chromosome)[1] < 
-            self._cached_decode_and_eval(self.best_chromosome)[1]):
-            
-            worst_index = offspring.index(worst_chromosome)
-            offspring[worst_index] = self.best_chromosome
+        if self.best_chromosome is not None and offspring_fitness[worst_index] < self.best_fitness:
+            offspring[worst_index] = self.best_chromosome.copy()
+            offspring_fitness[worst_index] = self.best_fitness
         
-        return offspring
+        return offspring, offspring_fitness
 
@@ -0,0 +1,188 @@
+from .scqbf_instance import *
+from .scqbf_solution import *
+from .scqbf_evaluator import *
+from .scqbf_ga import *
+import time
+import multiprocessing as mp
+import numpy as np
+
+from typing import List
+
+
+def _island_worker(conn, instance: ScQbfInstance, ga_kwargs: dict):
+    """
+    Worker process running one island. Waits for ("run", generations, deadline, migrants)
+    commands, evolves its sub-population and replies with its best fitness, best chromosome,
+    elite chromosomes for emigration and the number of generations actually run.
+    """
+    ga = ScQbfGA(instance, **ga_kwargs)
+    ga._initialize_search()
+    conn.send((ga.population_fitness.max(), ga.best_chromosome))
+
+    try:
+        while True:
+            command, generations, deadline, migrants, migration_size = conn.recv()
+            if command == "stop":
+                break
+
+            ga._receive_migrants(migrants)
+
+            done = 0
+            while done < generations and time.time() < deadline:
+                ga._iter += 1
+                ga._run_generation()
+                done += 1
+
+            conn.send((ga.best_fitness, ga.best_chromosome,
+                       ga._get_elite(migration_size), done))
+    finally:
+        conn.close()
+
+
+class ScQbfIslandGA:
+    """
+    Island-model GA: num_islands sub-populations evolve in separate worker processes and,
+    every migration_interval generations, each island sends its migration_size best
+    chromosomes to the next island in a ring, where they replace the worst individuals.
+
+    Termination options (max_iter, time_limit_secs, patience) are evaluated globally by the
+    coordinating process: max_iter and patience count generations per island, and patience
+    tracks improvements of the best solution over all islands.
+    """
+
+    def __init__(self, instance: ScQbfInstance, num_islands: int = 4, migration_interval: int = 10,
+                 migration_size: int = 2, population_size: int = 100, mutation_rate_multiplier: int = 1,
+                 ga_strategy: GAStrategy = GAStrategy(), termination_options: dict = {}, debug_options: dict = {},
+                 cache_options: dict = {}, seed: int = None):
+        if num_islands < 1:
+            raise ValueError(f"Number of islands must be positive, got {num_islands}.")
+        if migration_interval < 1:
+            raise ValueError(f"Migration interval must be positive, got {migration_interval}.")
+
+        self.instance = instance
+        self.evaluator = ScQbfEvaluator(instance)
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.termination_options = termination_options
+        self.debug_options = debug_options
+        self.seed = seed
+        self._ga_kwargs = {
+            'population_size': population_size,
+            'mutation_rate_multiplier': mutation_rate_multiplier,
+            'ga_strategy': ga_strategy,
+            'cache_options': cache_options,
+        }
+
+        self.best_chromosome: np.ndarray = None
+        self.best_solution: ScQbfSolution = None
+        self.island_best_fitness: List[float] = []
+
+        self._start_time = None
+        self.execution_time = 0.0
+        self._iter = 0                                  # Generations run by each island
+        self._no_improvement_iter = 0
+        self.stop_reason = None
+        self.history: list[float] = []
+
+    def _eval_termination_condition(self) -> bool:
+        self.execution_time = time.time() - self._start_time
+
+        max_iter = self.termination_options.get("max_iter", None)
+        time_limit_secs = self.termination_options.get("time_limit_secs", None)
+        patience = self.termination_options.get("patience", None)
+
+        if max_iter is not None and self._iter >= max_iter:
+            self.stop_reason = "max_iter"
+            return True
+        if time_limit_secs is not None and self.execution_time > time_limit_secs:
+            self.stop_reason = "time_limit"
+            return True
+        if patience is not None and self._no_improvement_iter > patience:
+            self.stop_reason = "patience_exceeded"
+            return True
+
+        return False
+
+    def _update_best(self, fitness: float, chromosome: np.ndarray) -> bool:
+        if self.best_solution is not None and fitness <= self.best_solution._objfun_val:
+            return False
+
+        self.best_chromosome = chromosome
+        self.best_solution = ScQbfSolution(np.flatnonzero(chromosome).tolist())
+        self.evaluator.evaluate_objfun(self.best_solution)
+        return True
+
+    def solve(self) -> ScQbfSolution:
+        """ Run the islands until a global termination condition is met and return the best solution. """
+        self._start_time = time.time()
+        self._iter = 0
+        self._no_improvement_iter = 0
+
+        time_limit_secs = self.termination_options.get("time_limit_secs", None)
+        deadline = self._start_time + time_limit_secs if time_limit_secs is not None else float("inf")
+        max_iter = self.termination_options.get("max_iter", None)
+
+        connections, processes = [], []
+        try:
+            # Independent, reproducible child streams, one per island
+            island_seeds = np.random.SeedSequence(self.seed).spawn(self.num_islands)
+            for island_seed in island_seeds:
+                parent_conn, child_conn = mp.Pipe()
+                process = mp.Process(target=_island_worker, args=(child_conn, self.instance, {**self._ga_kwargs, 'seed': island_seed}),
+                                     daemon=True)
+                process.start()
+                child_conn.close()
+                connections.append(parent_conn)
+                processes.append(process)
+
+            self.island_best_fitness = []
+            for conn in connections:
+                fitness, chromosome = conn.recv()
+                self.island_best_fitness.append(fitness)
+                self._update_best(fitness, chromosome)
+
+            no_migrants = np.empty((0, self.instance.n), dtype=np.uint8)
+            migrants = [no_migrants] * self.num_islands
+            while not self._eval_termination_condition():
+                generations = self.migration_interval
+                if max_iter is not None:
+                    generations = min(generations, max_iter - self._iter)
+
+                for conn, island_migrants in zip(connections, migrants):
+                    conn.send(("run", generations, deadline, island_migrants, self.migration_size))
+
+                improved = False
+                generations_run = 0
+                elites = []
+                for k, conn in enumerate(connections):
+                    fitness, chromosome, elite, done = conn.recv()
+                    self.island_best_fitness[k] = fitness
+                    improved |= self._update_best(fitness, chromosome)
+                    generations_run = max(generations_run, done)
+                    elites.append(elite)
+
+                # Ring topology: island k receives the elite of island k - 1
+                migrants = elites[-1:] + elites[:-1] if self.num_islands > 1 else [no_migrants]
+
+                self._iter += generations_run
+                self._no_improvement_iter = 0 if improved else self._no_improvement_iter + generations_run
+
+                if self.debug_options.get("verbose", False):
+                    print(f"Generation {self._iter}: Best fitness = {self.best_solution._objfun_val:.2f}, "
+                          f"islands = {[round(f, 2) for f in self.island_best_fitness]}")
+                if self.debug_options.get("save_history", False):
+                    self.history.append(self.best_solution._objfun_val)
+        finally:
+            for conn in connections:
+                try:
+                    conn.send(("stop", 0, 0.0, None, 0))
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+        self.execution_time = time.time() - self._start_time
+        return self.best_solution
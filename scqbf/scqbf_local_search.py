@@ -0,0 +1,110 @@
+from .scqbf_instance import *
+from .scqbf_solution import *
+from .scqbf_evaluator import *
+import numpy as np
+
+from typing import Literal
+
+# Moves must improve the objective by more than this to be applied
+IMPROVEMENT_EPS = 1e-9
+
+class ScQbfLocalSearch:
+    """
+    Coverage-preserving local search over the flip (insertion/removal) and swap neighborhoods.
+
+    Move values come from the O(1) deltas of ScQbfEvaluatedSolution, evaluated for a whole
+    neighborhood at once, and feasibility from the cover counts of ScQbfCoverageTracker:
+    a subset can leave the solution only if every element it covers uniquely stays covered
+    (for a swap, by the entering subset).
+
+    "best_improvement" applies the best flip or swap in each step; "first_improvement"
+    applies a random improving flip and only builds the swap neighborhood when no flip improves.
+    """
+
+    def __init__(self, instance: ScQbfInstance, strategy: Literal["first_improvement", "best_improvement"] = "best_improvement",
+                 max_moves: int = None, rng: np.random.Generator = None):
+        if strategy not in ("first_improvement", "best_improvement"):
+            raise ValueError(f"Unknown local search strategy: {strategy}")
+
+        self.instance = instance
+        self.strategy = strategy
+        self.max_moves = max_moves
+        self._rng = rng if rng is not None else np.random.default_rng()
+        self._incidence = instance.incidence.astype(np.float32)
+
+    def improve(self, chromosome: np.ndarray) -> tuple[np.ndarray, float, bool]:
+        """
+        Improve a feasible chromosome in place until a local optimum (or max_moves); returns it, its
+        fitness and whether it is a local optimum (False when the search was stopped by max_moves).
+        """
+        elements = np.flatnonzero(chromosome)
+        state = ScQbfEvaluatedSolution(self.instance, elements)
+        tracker = ScQbfCoverageTracker(self.instance, elements)
+
+        moves = 0
+        local_optimum = False
+        while self.max_moves is None or moves < self.max_moves:
+            move = self._find_move(state, tracker)
+            if move is None:
+                local_optimum = True
+                break
+
+            elem_in, elem_out = move
+            if elem_out is not None:
+                state.remove(elem_out)
+                tracker.remove(elem_out)
+            if elem_in is not None:
+                state.insert(elem_in)
+                tracker.insert(elem_in)
+            moves += 1
+
+        chromosome[:] = state.selected
+        return chromosome, state.objfun_val, local_optimum
+
+    def _find_move(self, state: ScQbfEvaluatedSolution, tracker: ScQbfCoverageTracker):
+        """ Returns the (elem_in, elem_out) move to apply, either side possibly None, or None at a local optimum. """
+        flip_deltas = self._flip_deltas(state, tracker)
+        if self.strategy == "first_improvement":
+            improving = np.flatnonzero(flip_deltas > IMPROVEMENT_EPS)
+            if len(improving) > 0:
+                return self._flip_move(state, int(self._rng.choice(improving)))
+
+        ins, outs, swap_deltas = self._swap_deltas(state, tracker)
+        best_flip = int(np.argmax(flip_deltas))
+        best_swap = np.unravel_index(np.argmax(swap_deltas), swap_deltas.shape) if swap_deltas.size else None
+
+        if best_swap is not None and swap_deltas[best_swap] > max(flip_deltas[best_flip], IMPROVEMENT_EPS):
+            return int(ins[best_swap[0]]), int(outs[best_swap[1]])
+        if flip_deltas[best_flip] > IMPROVEMENT_EPS:
+            return self._flip_move(state, best_flip)
+        return None
+
+    @staticmethod
+    def _flip_move(state: ScQbfEvaluatedSolution, elem: int):
+        return (None, elem) if state.selected[elem] else (elem, None)
+
+    def _flip_deltas(self, state: ScQbfEvaluatedSolution, tracker: ScQbfCoverageTracker) -> np.ndarray:
+        """ Delta of flipping each variable; -inf for removals that would uncover an element. """
+        deltas = np.where(state.selected, state.removal_deltas(), state.insertion_deltas())
+        uniquely_covering = (self.instance.incidence & (tracker.cover_counts == 1)).any(axis=1)
+        deltas[state.selected & uniquely_covering] = -np.inf
+        return deltas
+
+    def _swap_deltas(self, state: ScQbfEvaluatedSolution, tracker: ScQbfCoverageTracker):
+        """ Deltas of all (in, out) swaps as a matrix, with -inf for swaps that would uncover an element. """
+        ins = np.flatnonzero(~state.selected)
+        outs = np.flatnonzero(state.selected)
+        if len(ins) == 0 or len(outs) == 0:
+            return ins, outs, np.empty((0, 0))
+
+        deltas = (state.insertion_deltas()[ins][:, None] + state.removal_deltas()[outs][None, :]
+                  - self.instance.A_sym[np.ix_(ins, outs)])
+
+        # Elements only covered by out must be covered by in
+        unique = self._incidence[outs] * (tracker.cover_counts == 1)
+        constrained = np.flatnonzero(unique.any(axis=1))
+        if len(constrained) > 0:
+            missing = (1.0 - self._incidence[ins]) @ unique[constrained].T
+            deltas[:, constrained] = np.where(missing > 0, -np.inf, deltas[:, constrained])
+
+        return ins, outs, deltas
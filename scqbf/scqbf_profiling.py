@@ -0,0 +1,96 @@
+from dataclasses import dataclass, field, asdict
+from contextlib import nullcontext
+from typing import Dict
+import time
+
+@dataclass
+class PhaseStats:
+    total_time: float = 0.0
+    calls: int = 0
+
+@dataclass
+class ScQbfGAStats:
+    """
+    Snapshot of the GA instrumentation.
+
+    Phase timers are cumulative wall-clock seconds per phase; phases can nest (e.g. the
+    standard engine's "crossover" includes the "make_feasible" repairs it triggers).
+    """
+    phases: Dict[str, PhaseStats] = field(default_factory=dict)
+    generations: int = 0
+    elapsed_time: float = 0.0
+    evaluations: int = 0            # objective values actually computed (cache misses)
+    repaired_offspring: int = 0     # chromosomes passed through repair
+    repair_steps: int = 0           # subsets added by repair
+    cache_hit_rate: float = 0.0
+
+    @property
+    def evaluations_per_sec(self) -> float:
+        return self.evaluations / self.elapsed_time if self.elapsed_time > 0 else 0.0
+
+    @property
+    def repair_steps_per_offspring(self) -> float:
+        return self.repair_steps / self.repaired_offspring if self.repaired_offspring else 0.0
+
+    def as_dict(self) -> dict:
+        stats = asdict(self)
+        stats['evaluations_per_sec'] = self.evaluations_per_sec
+        stats['repair_steps_per_offspring'] = self.repair_steps_per_offspring
+        return stats
+
+class _PhaseTimer:
+    __slots__ = ('_stats', '_start')
+
+    def __init__(self, stats: PhaseStats):
+        self._stats = stats
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self._stats.total_time += time.perf_counter() - self._start
+        self._stats.calls += 1
+        return False
+
+class ScQbfProfiler:
+    """
+    Lightweight per-phase instrumentation for ScQbfGA. When disabled, phase() returns a shared
+    no-op context manager and the counters are plain integer additions, so the cost is negligible.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._phases: Dict[str, PhaseStats] = {}
+        self._timers: Dict[str, _PhaseTimer] = {}
+        self._null = nullcontext()
+        self.evaluations = 0
+        self.repaired_offspring = 0
+        self.repair_steps = 0
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return self._null
+
+        timer = self._timers.get(name)
+        if timer is None:
+            self._phases[name] = PhaseStats()
+            timer = self._timers[name] = _PhaseTimer(self._phases[name])
+        return timer
+
+    def count_evaluations(self, count: int):
+        self.evaluations += count
+
+    def count_repair(self, steps: int, chromosomes: int = 1):
+        self.repaired_offspring += chromosomes
+        self.repair_steps += steps
+
+    def snapshot(self, generations: int, elapsed_time: float, cache_hit_rate: float) -> ScQbfGAStats:
+        return ScQbfGAStats(
+            phases={name: PhaseStats(stats.total_time, stats.calls) for name, stats in self._phases.items()},
+            generations=generations,
+            elapsed_time=elapsed_time,
+            evaluations=self.evaluations,
+            repaired_offspring=self.repaired_offspring,
+            repair_steps=self.repair_steps,
+            cache_hit_rate=cache_hit_rate,
+        )
@@ -0,0 +1,94 @@
+import os
+import signal
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scqbf.scqbf_instance import *
+from scqbf.scqbf_ga import *
+
+INSTANCE_DIR = os.path.join(os.path.dirname(__file__), "..", "instances")
+
+STRATEGIES = [
+    GAStrategy(),
+    GAStrategy(engine="vectorized", mutation_strategy="adaptive"),
+    GAStrategy(engine="vectorized", mutation_strategy="adaptive", adaptive_schedule="entropy"),
+    GAStrategy(local_search="first_improvement", repair_strategy="random_restricted_candidate_list"),
+    GAStrategy(generation_model="steady_state", repair_strategy="greedy_ratio"),
+]
+
+
+def _assert_same_run(expected: ScQbfGA, actual: ScQbfGA):
+    assert actual.stop_reason == expected.stop_reason
+    assert actual._iter == expected._iter
+    assert actual.history == expected.history
+    assert np.array_equal(np.asarray(actual.population), np.asarray(expected.population))
+    assert np.array_equal(actual.population_fitness, expected.population_fitness)
+    assert actual.best_fitness == expected.best_fitness
+    assert actual.best_solution.elements == expected.best_solution.elements
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_resumed_run_matches_uninterrupted_run(strategy, tmp_path):
+    instance = read_max_sc_qbf_instance(os.path.join(INSTANCE_DIR, "gen100_01.txt"))
+    path = str(tmp_path / "ga.ckpt")
+    options = dict(ga_strategy=strategy, seed=7, debug_options={'save_history': True})
+
+    reference = ScQbfGA(instance, 30, termination_options={'max_iter': 20}, **options)
+    reference.solve()
+
+    first_half = ScQbfGA(instance, 30, termination_options={'max_iter': 10}, checkpoint_options={'path': path, 'interval': 5},
+                         **options)
+    first_half.solve()
+    assert os.path.exists(path)
+
+    resumed = ScQbfGA(instance, 30, termination_options={'max_iter': 20}, **options)
+    resumed.solve(resume_from=path)
+    _assert_same_run(reference, resumed)
+
+
+def test_resume_reuses_cached_fitness(tmp_path):
+    # Stopped at generation 19, a chromosome scored in an earlier batch is met again; scored in a
+    # different batch after resuming, its fitness rounds differently unless the cache is restored
+    instance = read_max_sc_qbf_instance(os.path.join(INSTANCE_DIR, "gen025_01.txt"))
+    path = str(tmp_path / "ga.ckpt")
+    options = dict(seed=3, debug_options={'save_history': True})
+
+    ScQbfGA(instance, 20, termination_options={'max_iter': 19}, checkpoint_options={'path': path, 'interval': 19}, **options).solve()
+    reference = ScQbfGA(instance, 20, termination_options={'max_iter': 24}, **options)
+    reference.solve()
+    resumed = ScQbfGA(instance, 20, termination_options={'max_iter': 24}, **options)
+    resumed.solve(resume_from=path)
+    _assert_same_run(reference, resumed)
+
+
+def test_sigterm_checkpoints_and_stops(tmp_path):
+    instance = read_max_sc_qbf_instance(os.path.join(INSTANCE_DIR, "gen025_01.txt"))
+    path = str(tmp_path / "ga.ckpt")
+    options = dict(seed=3, debug_options={'save_history': True})
+    previous_handler = signal.getsignal(signal.SIGTERM)
+
+    ga = ScQbfGA(instance, 20, termination_options={'max_iter': 10**6, 'time_limit_secs': 30},
+                 checkpoint_options={'path': path}, **options)
+    timer = threading.Timer(0.5, os.kill, args=(os.getpid(), signal.SIGTERM))
+    timer.start()
+    try:
+        ga.solve()
+    finally:
+        timer.cancel()
+
+    assert ga.stop_reason == "signal"
+    assert os.path.exists(path)
+    assert signal.getsignal(signal.SIGTERM) == previous_handler
+
+    # The checkpoint holds the state of the generation the search stopped at
+    stopped_at = ga._iter
+    reference = ScQbfGA(instance, 20, termination_options={'max_iter': stopped_at + 5}, **options)
+    reference.solve()
+    resumed = ScQbfGA(instance, 20, termination_options={'max_iter': stopped_at + 5}, **options)
+    resumed.solve(resume_from=path)
+    _assert_same_run(reference, resumed)
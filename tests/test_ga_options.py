@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scqbf.scqbf_instance import *
+from scqbf.scqbf_ga import *
+
+INSTANCE_PATH = os.path.join(os.path.dirname(__file__), "..", "instances", "gen025_01.txt")
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_backend_requires_vectorized_engine(backend):
+    instance = read_max_sc_qbf_instance(INSTANCE_PATH)
+    with pytest.raises(ValueError):
+        ScQbfGA(instance, parallel_options={'backend': backend})
+
+    ga = ScQbfGA(instance, 10, ga_strategy=GAStrategy(engine="vectorized"), parallel_options={'backend': backend, 'workers': 1},
+                 termination_options={'max_iter': 2}, seed=0)
+    ga.solve()
+    assert ga.best_solution is not None
+
+
+@pytest.mark.parametrize("interval", [0, -1])
+def test_adaptive_interval_must_be_positive(interval):
+    instance = read_max_sc_qbf_instance(INSTANCE_PATH)
+    with pytest.raises(ValueError):
+        ScQbfGA(instance, ga_strategy=GAStrategy(mutation_strategy="adaptive", adaptive_interval=interval))
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scqbf.scqbf_instance import *
+from scqbf.scqbf_ga import *
+
+INSTANCE_PATH = os.path.join(os.path.dirname(__file__), "..", "instances", "gen100_01.txt")
+
+
+def test_capped_search_is_not_reported_as_local_optimum():
+    instance = read_max_sc_qbf_instance(INSTANCE_PATH)
+    chromosome = np.ones(instance.n, dtype=np.uint8)
+
+    _, _, local_optimum = ScQbfLocalSearch(instance, max_moves=1).improve(chromosome.copy())
+    assert not local_optimum
+
+    improved, fitness, local_optimum = ScQbfLocalSearch(instance).improve(chromosome.copy())
+    assert local_optimum
+    assert np.isclose(fitness, ScQbfEvaluator(instance).evaluate_objfun(ScQbfSolution(np.flatnonzero(improved).tolist())))
+
+
+def test_ga_only_records_true_local_optima_with_move_cap():
+    instance = read_max_sc_qbf_instance(INSTANCE_PATH)
+    strategy = GAStrategy(local_search="best_improvement", local_search_rate=1.0, local_search_max_moves=2)
+    ga = ScQbfGA(instance, 20, ga_strategy=strategy, termination_options={'max_iter': 15}, seed=0)
+    ga.solve()
+    assert len(ga._local_optima) > 0
+
+    unrestricted = ScQbfLocalSearch(instance)
+    for key, fitness in ga._local_optima.items():
+        chromosome = np.unpackbits(np.frombuffer(key, dtype=np.uint8), count=instance.n)
+        improved, improved_fitness, local_optimum = unrestricted.improve(chromosome.copy())
+        assert local_optimum
+        assert np.array_equal(improved, chromosome)
+        assert np.isclose(improved_fitness, fitness)
@@ -0,0 +1,29 @@
+import glob
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scqbf.scqbf_instance import *
+from scqbf.scqbf_evaluator import *
+from scqbf.scqbf_ga import repair_chromosome
+
+INSTANCE_DIR = os.path.join(os.path.dirname(__file__), "..", "instances")
+INSTANCES = sorted(glob.glob(os.path.join(INSTANCE_DIR, "gen*_*.txt")) + glob.glob(os.path.join(INSTANCE_DIR, "gen[123]", "*.txt")))
+
+
+@pytest.mark.parametrize("path", INSTANCES)
+def test_greedy_repair_adds_no_more_subsets_than_random(path):
+    instance = read_max_sc_qbf_instance(path)
+    rng = np.random.default_rng(0)
+
+    random_added = np.mean([repair_chromosome(instance, np.zeros(instance.n, dtype=np.uint8), rng, "random")
+                            for _ in range(20)])
+    chromosome = np.zeros(instance.n, dtype=np.uint8)
+    greedy_added = repair_chromosome(instance, chromosome, rng, "greedy_ratio")
+
+    assert greedy_added <= random_added
+    assert ScQbfEvaluator(instance).is_solution_feasible(ScQbfSolution(np.flatnonzero(chromosome).tolist()))
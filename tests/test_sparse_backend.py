@@ -0,0 +1,75 @@
+import glob
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scqbf.scqbf_instance import *
+from scqbf.scqbf_evaluator import *
+from scqbf.scqbf_ga import repair_chromosome
+
+INSTANCE_DIR = os.path.join(os.path.dirname(__file__), "..", "instances")
+INSTANCES = sorted(glob.glob(os.path.join(INSTANCE_DIR, "gen*_*.txt")))
+
+
+def _backends(path):
+    return read_max_sc_qbf_instance(path, backend="dense"), read_max_sc_qbf_instance(path, backend="sparse")
+
+
+@pytest.mark.parametrize("path", INSTANCES)
+def test_dense_and_sparse_evaluated_solutions_match(path):
+    dense, sparse = _backends(path)
+    rng = np.random.default_rng(0)
+    n = dense.n
+
+    for elements in ([], np.flatnonzero(rng.random(n) < 0.3).tolist(), list(range(n))):
+        dense_state = ScQbfEvaluatedSolution(dense, elements)
+        sparse_state = ScQbfEvaluatedSolution(sparse, elements)
+        assert sparse_state.interaction.dtype == np.float64
+        assert np.isclose(dense_state.objfun_val, sparse_state.objfun_val)
+        assert np.isclose(ScQbfEvaluator(sparse).evaluate_objfun(ScQbfSolution(elements)), dense_state.objfun_val)
+
+        for elem in rng.integers(0, n, size=20):
+            dense_state.flip(int(elem))
+            sparse_state.flip(int(elem))
+            assert np.allclose(dense_state.interaction, sparse_state.interaction)
+            assert np.isclose(dense_state.objfun_val, sparse_state.objfun_val)
+            assert np.allclose(dense_state.insertion_deltas(), sparse_state.insertion_deltas())
+            assert np.allclose(dense_state.removal_deltas(), sparse_state.removal_deltas())
+
+
+@pytest.mark.parametrize("path", INSTANCES)
+@pytest.mark.parametrize("strategy", ["random", "greedy_ratio", "random_restricted_candidate_list"])
+def test_repair_from_empty_chromosome_matches_between_backends(path, strategy):
+    dense, sparse = _backends(path)
+    dense_chromosome = np.zeros(dense.n, dtype=np.uint8)
+    sparse_chromosome = np.zeros(sparse.n, dtype=np.uint8)
+
+    repair_chromosome(dense, dense_chromosome, np.random.default_rng(1), strategy)
+    repair_chromosome(sparse, sparse_chromosome, np.random.default_rng(1), strategy)
+
+    assert np.array_equal(dense_chromosome, sparse_chromosome)
+    assert ScQbfEvaluator(sparse).is_solution_feasible(ScQbfSolution(np.flatnonzero(sparse_chromosome).tolist()))
+
+
+def test_sparse_instance_evaluation_matches_dense():
+    rng = np.random.default_rng(2)
+    n = 300
+    A = np.triu(np.where(rng.random((n, n)) < 0.02, rng.integers(-10, 11, size=(n, n)), 0)).astype(np.float64)
+    incidence = rng.random((n, n)) < 0.01
+    np.fill_diagonal(incidence, True)
+    dense = ScQbfInstance(n, A, incidence, backend="dense")
+    sparse = ScQbfInstance(n, A, incidence, backend="auto")
+    assert sparse.backend == "sparse"
+
+    X = (rng.random((50, n)) < 0.3).astype(np.uint8)
+    X[0] = 0
+    dense_values = ScQbfEvaluator(dense).evaluate_objfun_batch(X)
+    assert np.allclose(ScQbfEvaluator(sparse).evaluate_objfun_batch(X), dense_values)
+    for x, value in zip(X, dense_values):
+        elements = np.flatnonzero(x).tolist()
+        assert np.isclose(ScQbfEvaluator(sparse).evaluate_objfun(ScQbfSolution(elements)), value)
+        assert np.isclose(ScQbfEvaluatedSolution(sparse, elements).objfun_val, value)